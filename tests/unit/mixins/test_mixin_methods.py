@@ -1,6 +1,7 @@
 import pytest
 import responses
 
+import gitlab
 from gitlab import base
 from gitlab import types as gl_types
 from gitlab.mixins import (
@@ -15,6 +16,11 @@ from gitlab.mixins import (
     UpdateMixin,
 )
 
+pytestmark = pytest.mark.mixins
+
+_RO_FOO_BAR_BAZ = gl_types.RequiredOptional(required=("foo",), optional=("bar", "baz"))
+_RO_FOO_BAM = gl_types.RequiredOptional(required=("foo",), optional=("bam",))
+
 
 class FakeObject(base.RESTObject):
     pass
@@ -25,98 +31,274 @@ class FakeManager(base.RESTManager):
     _obj_cls = FakeObject
 
 
-@responses.activate
-def test_get_mixin(gl):
-    class M(GetMixin, FakeManager):
-        pass
+class FakeRefreshObject(RefreshMixin, FakeObject):
+    pass
 
-    url = "http://localhost/api/v4/tests/42"
-    responses.add(
-        method=responses.GET,
-        url=url,
-        json={"id": 42, "foo": "bar"},
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
+
+class FakeSaveObject(SaveMixin, base.RESTObject):
+    pass
+
+
+class MGet(GetMixin, FakeManager):
+    pass
+
+
+class MGetWithoutId(GetWithoutIdMixin, FakeManager):
+    _path = "/settings"
+
+
+class MList(ListMixin, FakeManager):
+    pass
+
+
+class MCreate(CreateMixin, FakeManager):
+    _create_attrs = _RO_FOO_BAR_BAZ
+    _update_attrs = _RO_FOO_BAM
+
+
+class MUpdate(UpdateMixin, FakeManager):
+    pass
+
+
+class MUpdateWithAttrs(UpdateMixin, FakeManager):
+    _create_attrs = _RO_FOO_BAR_BAZ
+    _update_attrs = _RO_FOO_BAM
+
+
+class MUpdateUsesPost(UpdateMixin, FakeManager):
+    _update_uses_post = True
+
+
+class MDelete(DeleteMixin, FakeManager):
+    pass
+
+
+class MSet(SetMixin, FakeManager):
+    pass
+
+
+# Every response the tests need, registered once for the whole module.
+MOCKED_RESPONSES = [
+    {
+        "method": responses.GET,
+        "url": "http://localhost/api/v4/tests/42",
+        "json": {"id": 42, "foo": "bar"},
+    },
+    {
+        "method": responses.GET,
+        "url": "http://localhost/api/v4/settings",
+        "json": {"foo": "bar"},
+    },
+    {
+        "method": responses.GET,
+        "url": "http://localhost/api/v4/tests",
+        "json": [{"id": 42, "foo": "bar"}, {"id": 43, "foo": "baz"}],
+        "headers": {
+            "X-Page": "1",
+            "X-Next-Page": "2",
+            "X-Per-Page": "1",
+            "X-Total-Pages": "2",
+            "X-Total": "2",
+            "Link": ("<http://localhost/api/v4/tests" ' rel="next"'),
+        },
+    },
+    {
+        "method": responses.GET,
+        "url": "http://localhost/api/v4/others",
+        "json": [{"id": 42, "foo": "bar"}],
+    },
+    {
+        "method": responses.POST,
+        "url": "http://localhost/api/v4/tests",
+        "json": {"id": 42, "foo": "bar"},
+    },
+    {
+        "method": responses.POST,
+        "url": "http://localhost/api/v4/others",
+        "json": {"id": 42, "foo": "bar"},
+    },
+    {
+        "method": responses.PUT,
+        "url": "http://localhost/api/v4/tests/42",
+        "json": {"id": 42, "foo": "baz"},
+    },
+    {
+        "method": responses.PUT,
+        "url": "http://localhost/api/v4/tests",
+        "json": {"foo": "baz"},
+    },
+    {
+        "method": responses.POST,
+        "url": "http://localhost/api/v4/tests/1",
+        "json": {},
+    },
+    {
+        "method": responses.PUT,
+        "url": "http://localhost/api/v4/tests/1",
+    },
+    {
+        "method": responses.DELETE,
+        "url": "http://localhost/api/v4/tests/42",
+        "json": "",
+    },
+    {
+        "method": responses.PUT,
+        "url": "http://localhost/api/v4/tests/foo",
+        "json": {"key": "foo", "value": "bar"},
+    },
+]
+
+
+@pytest.fixture(scope="module")
+def gl():
+    # None of these tests change client state, so share one client per module
+    return gitlab.Gitlab(
+        "http://localhost",
+        private_token="private_token",
+        ssl_verify=True,
+        api_version="4",
     )
 
-    mgr = M(gl)
-    obj = mgr.get(42)
-    assert isinstance(obj, FakeObject)
-    assert obj.foo == "bar"
-    assert obj.id == 42
-    assert responses.assert_call_count(url, 1) is True
 
+@pytest.fixture(scope="module", autouse=True)
+def mocked_responses():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+
+@pytest.fixture(scope="module")
+def registered_responses(mocked_responses):
+    return {
+        (response["method"], response["url"]): mocked_responses.add(
+            status=200, **response
+        )
+        for response in MOCKED_RESPONSES
+    }
 
-@responses.activate
-def test_refresh_mixin(gl):
-    class TestClass(RefreshMixin, FakeObject):
-        pass
 
+@pytest.fixture(autouse=True)
+def reset_calls(mocked_responses, registered_responses):
+    yield
+    mocked_responses.calls.reset()
+    for rsp in registered_responses.values():
+        rsp.calls.reset()
+
+
+@pytest.mark.parametrize(
+    "manager_cls,method,path,call,result_cls,expected",
+    [
+        pytest.param(
+            MGet,
+            responses.GET,
+            "/tests/42",
+            lambda mgr: mgr.get(42),
+            FakeObject,
+            {"id": 42, "foo": "bar"},
+            id="get",
+        ),
+        pytest.param(
+            MGetWithoutId,
+            responses.GET,
+            "/settings",
+            lambda mgr: mgr.get(),
+            FakeObject,
+            {"foo": "bar"},
+            id="get-without-id",
+        ),
+        pytest.param(
+            MUpdateWithAttrs,
+            responses.PUT,
+            "/tests/42",
+            lambda mgr: mgr.update(42, {"foo": "baz"}),
+            dict,
+            {"id": 42, "foo": "baz"},
+            id="update",
+        ),
+        pytest.param(
+            MUpdateUsesPost,
+            responses.POST,
+            "/tests/1",
+            lambda mgr: mgr.update(1, {}),
+            dict,
+            {},
+            id="update-uses-post",
+        ),
+        pytest.param(
+            MUpdateWithAttrs,
+            responses.PUT,
+            "/tests",
+            lambda mgr: mgr.update(new_data={"foo": "baz"}),
+            dict,
+            {"foo": "baz"},
+            id="update-no-id",
+        ),
+        pytest.param(
+            MDelete,
+            responses.DELETE,
+            "/tests/42",
+            lambda mgr: mgr.delete(42),
+            type(None),
+            None,
+            id="delete",
+        ),
+        pytest.param(
+            MSet,
+            responses.PUT,
+            "/tests/foo",
+            lambda mgr: mgr.set("foo", "bar"),
+            FakeObject,
+            {"key": "foo", "value": "bar"},
+            id="set",
+        ),
+    ],
+)
+def test_simple_mixin_methods(
+    gl,
+    registered_responses,
+    manager_cls,
+    method,
+    path,
+    call,
+    result_cls,
+    expected,
+):
+    rsp = registered_responses[method, f"http://localhost/api/v4{path}"]
+
+    mgr = manager_cls(gl)
+    result = call(mgr)
+    assert isinstance(result, result_cls)
+    if isinstance(result, FakeObject):
+        result = result.attributes
+    assert result == expected
+    assert rsp.call_count == 1
+
+
+def test_get_mixin_sends_no_query_string(gl, registered_responses):
     url = "http://localhost/api/v4/tests/42"
-    responses.add(
-        method=responses.GET,
-        url=url,
-        json={"id": 42, "foo": "bar"},
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
+    rsp = registered_responses[responses.GET, url]
+
+    mgr = MGet(gl)
+    mgr.get(42)
+    assert rsp.call_count == 1
+    assert rsp.calls[0].request.url == url
+
+
+def test_refresh_mixin(gl, registered_responses):
+    rsp = registered_responses[responses.GET, "http://localhost/api/v4/tests/42"]
 
     mgr = FakeManager(gl)
-    obj = TestClass(mgr, {"id": 42})
+    obj = FakeRefreshObject(mgr, {"id": 42})
     res = obj.refresh()
     assert res is None
     assert obj.foo == "bar"
     assert obj.id == 42
-    assert responses.assert_call_count(url, 1) is True
-
-
-@responses.activate
-def test_get_without_id_mixin(gl):
-    class M(GetWithoutIdMixin, FakeManager):
-        pass
+    assert rsp.call_count == 1
 
-    url = "http://localhost/api/v4/tests"
-    responses.add(
-        method=responses.GET,
-        url=url,
-        json={"foo": "bar"},
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
 
-    mgr = M(gl)
-    obj = mgr.get()
-    assert isinstance(obj, FakeObject)
-    assert obj.foo == "bar"
-    assert not hasattr(obj, "id")
-    assert responses.assert_call_count(url, 1) is True
-
-
-@responses.activate
-def test_list_mixin(gl):
-    class M(ListMixin, FakeManager):
-        pass
-
-    url = "http://localhost/api/v4/tests"
-    headers = {
-        "X-Page": "1",
-        "X-Next-Page": "2",
-        "X-Per-Page": "1",
-        "X-Total-Pages": "2",
-        "X-Total": "2",
-        "Link": ("<http://localhost/api/v4/tests" ' rel="next"'),
-    }
-    responses.add(
-        method=responses.GET,
-        headers=headers,
-        url=url,
-        json=[{"id": 42, "foo": "bar"}, {"id": 43, "foo": "baz"}],
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
+def test_list_mixin(gl, registered_responses):
+    rsp = registered_responses[responses.GET, "http://localhost/api/v4/tests"]
 
-    # test RESTObjectList
-    mgr = M(gl)
+    mgr = MList(gl)
     obj_list = mgr.list(iterator=True)
     assert isinstance(obj_list, base.RESTObjectList)
     assert obj_list.current_page == 1
@@ -127,35 +309,27 @@ def test_list_mixin(gl):
     assert obj_list.total_pages == 2
     assert len(obj_list) == 2
 
-    for obj in obj_list:
-        assert isinstance(obj, FakeObject)
-        assert obj.id in (42, 43)
+    objs = list(obj_list)
+    assert [obj.id for obj in objs] == [42, 43]
+    assert all(isinstance(obj, FakeObject) for obj in objs)
+    assert rsp.call_count == 1
+
 
-    # test list()
+def test_list_mixin_all(gl, registered_responses):
+    rsp = registered_responses[responses.GET, "http://localhost/api/v4/tests"]
+
+    mgr = MList(gl)
     obj_list = mgr.list(all=True)
     assert isinstance(obj_list, list)
     assert obj_list[0].id == 42
     assert obj_list[1].id == 43
     assert isinstance(obj_list[0], FakeObject)
     assert len(obj_list) == 2
-    assert responses.assert_call_count(url, 2) is True
-
+    assert rsp.call_count == 1
 
-@responses.activate
-def test_list_other_url(gl):
-    class M(ListMixin, FakeManager):
-        pass
-
-    url = "http://localhost/api/v4/others"
-    responses.add(
-        method=responses.GET,
-        url=url,
-        json=[{"id": 42, "foo": "bar"}],
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
 
-    mgr = M(gl)
+def test_list_other_url(gl, mocked_responses):
+    mgr = MList(gl)
     obj_list = mgr.list(path="/others", iterator=True)
     assert isinstance(obj_list, base.RESTObjectList)
     obj = obj_list.next()
@@ -165,237 +339,46 @@ def test_list_other_url(gl):
         obj_list.next()
 
 
-def test_create_mixin_missing_attrs(gl):
-    class M(CreateMixin, FakeManager):
-        _create_attrs = gl_types.RequiredOptional(
-            required=("foo",), optional=("bar", "baz")
-        )
-
-    mgr = M(gl)
-    data = {"foo": "bar", "baz": "blah"}
-    mgr._create_attrs.validate_attrs(data=data)
-
-    data = {"baz": "blah"}
-    with pytest.raises(AttributeError) as error:
-        mgr._create_attrs.validate_attrs(data=data)
-    assert "foo" in str(error.value)
+def test_create_mixin(gl, registered_responses):
+    rsp = registered_responses[responses.POST, "http://localhost/api/v4/tests"]
 
-
-@responses.activate
-def test_create_mixin(gl):
-    class M(CreateMixin, FakeManager):
-        _create_attrs = gl_types.RequiredOptional(
-            required=("foo",), optional=("bar", "baz")
-        )
-        _update_attrs = gl_types.RequiredOptional(required=("foo",), optional=("bam",))
-
-    url = "http://localhost/api/v4/tests"
-    responses.add(
-        method=responses.POST,
-        url=url,
-        json={"id": 42, "foo": "bar"},
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
-
-    mgr = M(gl)
+    mgr = MCreate(gl)
     obj = mgr.create({"foo": "bar"})
     assert isinstance(obj, FakeObject)
     assert obj.id == 42
     assert obj.foo == "bar"
-    assert responses.assert_call_count(url, 1) is True
+    assert rsp.call_count == 1
 
 
-@responses.activate
-def test_create_mixin_custom_path(gl):
-    class M(CreateMixin, FakeManager):
-        _create_attrs = gl_types.RequiredOptional(
-            required=("foo",), optional=("bar", "baz")
-        )
-        _update_attrs = gl_types.RequiredOptional(required=("foo",), optional=("bam",))
-
-    url = "http://localhost/api/v4/others"
-    responses.add(
-        method=responses.POST,
-        url=url,
-        json={"id": 42, "foo": "bar"},
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
+def test_create_mixin_custom_path(gl, registered_responses):
+    rsp = registered_responses[responses.POST, "http://localhost/api/v4/others"]
 
-    mgr = M(gl)
+    mgr = MCreate(gl)
     obj = mgr.create({"foo": "bar"}, path="/others")
     assert isinstance(obj, FakeObject)
     assert obj.id == 42
     assert obj.foo == "bar"
-    assert responses.assert_call_count(url, 1) is True
-
-
-def test_update_mixin_missing_attrs(gl):
-    class M(UpdateMixin, FakeManager):
-        _update_attrs = gl_types.RequiredOptional(
-            required=("foo",), optional=("bar", "baz")
-        )
-
-    mgr = M(gl)
-    data = {"foo": "bar", "baz": "blah"}
-    mgr._update_attrs.validate_attrs(data=data)
-
-    data = {"baz": "blah"}
-    with pytest.raises(AttributeError) as error:
-        mgr._update_attrs.validate_attrs(data=data)
-    assert "foo" in str(error.value)
-
-
-@responses.activate
-def test_update_mixin(gl):
-    class M(UpdateMixin, FakeManager):
-        _create_attrs = gl_types.RequiredOptional(
-            required=("foo",), optional=("bar", "baz")
-        )
-        _update_attrs = gl_types.RequiredOptional(required=("foo",), optional=("bam",))
-
-    url = "http://localhost/api/v4/tests/42"
-    responses.add(
-        method=responses.PUT,
-        url=url,
-        json={"id": 42, "foo": "baz"},
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
-
-    mgr = M(gl)
-    server_data = mgr.update(42, {"foo": "baz"})
-    assert isinstance(server_data, dict)
-    assert server_data["id"] == 42
-    assert server_data["foo"] == "baz"
-    assert responses.assert_call_count(url, 1) is True
-
-
-@responses.activate
-def test_update_mixin_uses_post(gl):
-    class M(UpdateMixin, FakeManager):
-        _update_uses_post = True
-
-    url = "http://localhost/api/v4/tests/1"
-    responses.add(
-        method=responses.POST,
-        url=url,
-        json={},
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
-
-    mgr = M(gl)
-    mgr.update(1, {})
-    assert responses.assert_call_count(url, 1) is True
-
-
-@responses.activate
-def test_update_mixin_no_id(gl):
-    class M(UpdateMixin, FakeManager):
-        _create_attrs = gl_types.RequiredOptional(
-            required=("foo",), optional=("bar", "baz")
-        )
-        _update_attrs = gl_types.RequiredOptional(required=("foo",), optional=("bam",))
-
-    url = "http://localhost/api/v4/tests"
-    responses.add(
-        method=responses.PUT,
-        url=url,
-        json={"foo": "baz"},
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
-
-    mgr = M(gl)
-    server_data = mgr.update(new_data={"foo": "baz"})
-    assert isinstance(server_data, dict)
-    assert server_data["foo"] == "baz"
-    assert responses.assert_call_count(url, 1) is True
-
-
-@responses.activate
-def test_delete_mixin(gl):
-    class M(DeleteMixin, FakeManager):
-        pass
-
-    url = "http://localhost/api/v4/tests/42"
-    responses.add(
-        method=responses.DELETE,
-        url=url,
-        json="",
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
-
-    mgr = M(gl)
-    mgr.delete(42)
-    assert responses.assert_call_count(url, 1) is True
+    assert rsp.call_count == 1
 
 
-@responses.activate
-def test_save_mixin(gl):
-    class M(UpdateMixin, FakeManager):
-        pass
+def test_save_mixin(gl, registered_responses):
+    rsp = registered_responses[responses.PUT, "http://localhost/api/v4/tests/42"]
 
-    class TestClass(SaveMixin, base.RESTObject):
-        pass
-
-    url = "http://localhost/api/v4/tests/42"
-    responses.add(
-        method=responses.PUT,
-        url=url,
-        json={"id": 42, "foo": "baz"},
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
-
-    mgr = M(gl)
-    obj = TestClass(mgr, {"id": 42, "foo": "bar"})
+    mgr = MUpdate(gl)
+    obj = FakeSaveObject(mgr, {"id": 42, "foo": "bar"})
     obj.foo = "baz"
     obj.save()
     assert obj._attrs["foo"] == "baz"
     assert obj._updated_attrs == {}
-    assert responses.assert_call_count(url, 1) is True
-
-
-@responses.activate
-def test_save_mixin_without_new_data(gl):
-    class M(UpdateMixin, FakeManager):
-        pass
+    assert rsp.call_count == 1
 
-    class TestClass(SaveMixin, base.RESTObject):
-        pass
 
-    url = "http://localhost/api/v4/tests/1"
-    responses.add(method=responses.PUT, url=url)
+def test_save_mixin_without_new_data(gl, registered_responses):
+    rsp = registered_responses[responses.PUT, "http://localhost/api/v4/tests/1"]
 
-    mgr = M(gl)
-    obj = TestClass(mgr, {"id": 1, "foo": "bar"})
+    mgr = MUpdate(gl)
+    obj = FakeSaveObject(mgr, {"id": 1, "foo": "bar"})
     obj.save()
 
     assert obj._attrs["foo"] == "bar"
-    assert responses.assert_call_count(url, 0) is True
-
-
-@responses.activate
-def test_set_mixin(gl):
-    class M(SetMixin, FakeManager):
-        pass
-
-    url = "http://localhost/api/v4/tests/foo"
-    responses.add(
-        method=responses.PUT,
-        url=url,
-        json={"key": "foo", "value": "bar"},
-        status=200,
-        match=[responses.matchers.query_param_matcher({})],
-    )
-
-    mgr = M(gl)
-    obj = mgr.set("foo", "bar")
-    assert isinstance(obj, FakeObject)
-    assert obj.key == "foo"
-    assert obj.value == "bar"
-    assert responses.assert_call_count(url, 1) is True
+    assert rsp.call_count == 0
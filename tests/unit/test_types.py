@@ -55,6 +55,12 @@ class TestRequiredOptional:
         with pytest.raises(AttributeError, match="Missing attributes: required1"):
             rq.validate_attrs(data=data)
 
+    def test_validate_attrs_required_with_optional(self):
+        rq = types.RequiredOptional(required=("foo",), optional=("bar", "baz"))
+        rq.validate_attrs(data={"foo": "bar", "baz": "blah"})
+        with pytest.raises(AttributeError, match="Missing attributes: foo"):
+            rq.validate_attrs(data={"baz": "blah"})
+
     def test_validate_attrs_exclusive(self):
         data = {"exclusive1": 1, "optional1": 1}
         rq = types.RequiredOptional(exclusive=("exclusive1", "exclusive2"))